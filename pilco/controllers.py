@@ -1,3 +1,4 @@
+import numbers
 import tensorflow as tf
 import numpy as np
 import gpflow
@@ -14,22 +15,44 @@ def squash_sin(m, s, max_action=None):
     OUT: mean (M) variance (S) and input-output (C) covariance of the squashed
          control input
     '''
-    k = tf.shape(m)[1]
+    m = tf.convert_to_tensor(m, dtype=float_type)
+    k = m.shape[1].value  # static when known, so no shape op ends up in the graph
+    if k is None:
+        k = tf.shape(m)[1]
     if max_action is None:
-        max_action = tf.ones((1,k), dtype=float_type)  #squashes in [-1,1] by default
+        max_action = 1.0  #squashes in [-1,1] by default
+    if isinstance(k, int) and isinstance(max_action, (numbers.Number, np.ndarray)):
+        # Broadcast in NumPy so the graph holds a constant row, not a tf.ones product
+        max_action = max_action * np.ones((1, k), dtype=float_type)
     else:
         max_action = max_action * tf.ones((1,k), dtype=float_type)
 
-    M = max_action * tf.exp(-tf.diag_part(s) / 2) * tf.sin(m)
+    if k == 1:
+        # With a single control cos(m - m) = 1 and all the k x k algebra
+        # below reduces to elementwise operations on [1, 1] tensors
+        exp_half_s = tf.exp(-s / 2)
+        q = tf.square(exp_half_s)
+        M = max_action * exp_half_s * tf.sin(m)
+        S = max_action * max_action * ((1 - q) - (tf.square(q) - q) * tf.cos(2 * m)) / 2
+        C = max_action * exp_half_s * tf.cos(m)
+        return M, S, C
 
-    lq = -( tf.diag_part(s)[:, None] + tf.diag_part(s)[None, :]) / 2
+    half_ds = -tf.diag_part(s) / 2
+    exp_half_ds = tf.exp(half_ds)
+    sin_m = tf.sin(m[0])
+    cos_m = tf.cos(m[0])
+    M = max_action * exp_half_ds * sin_m
+
+    # cos(m_i -/+ m_j) = cos(m_i)cos(m_j) +/- sin(m_i)sin(m_j)
+    cc = cos_m[:, None] * cos_m[None, :]
+    ss = sin_m[:, None] * sin_m[None, :]
+    lq = half_ds[:, None] + half_ds[None, :]
     q = tf.exp(lq)
-    S = (tf.exp(lq + s) - q) * tf.cos(tf.transpose(m) - m) \
-        - (tf.exp(lq - s) - q) * tf.cos(tf.transpose(m) + m)
+    S = (tf.exp(lq + s) - q) * (cc + ss) - (tf.exp(lq - s) - q) * (cc - ss)
     S = max_action * tf.transpose(max_action) * S / 2
 
-    C = max_action * tf.diag( tf.exp(-tf.diag_part(s)/2) * tf.cos(m))
-    return M, S, tf.reshape(C,shape=[k,k])
+    C = max_action * tf.diag(exp_half_ds * cos_m)
+    return M, S, C
 
 
 class LinearController(gpflow.Parameterized):
@@ -39,16 +62,24 @@ class LinearController(gpflow.Parameterized):
         self.b = gpflow.Param(np.random.rand(1, control_dim))
         self.max_action = max_action
 
+    def calculate_factorizations(self):
+        '''
+        The affine controller has no state-independent factorizations to
+        precompute for a rollout.
+        '''
+        return None
+
     @gpflow.params_as_tensors
-    def compute_action(self, m, s, squash=True):
+    def compute_action(self, m, s, squash=True, factorizations=None):
         '''
         Simple affine action:  M <- W(m-t) - b
-        IN: mean (m) and variance (s) of the state
+        IN: mean (m) and variance (s) of the state. factorizations is
+            accepted for a uniform controller interface and is unused
         OUT: mean (M) and variance (S) of the action
         '''
-        M = m @ tf.transpose(self.W) + self.b # mean output
-        S = self.W @ s @ tf.transpose(self.W) # output variance
         V = tf.transpose(self.W) #input output covariance
+        M = m @ V + self.b # mean output
+        S = tf.matmul(self.W @ s, self.W, transpose_b=True) # output variance
         if squash:
             M, S, V2 = squash_sin(M, S, self.max_action)
             V = V @ V2
@@ -89,16 +120,32 @@ class RbfController(MGPR):
         for i in range(self.num_outputs):
             kern = gpflow.kernels.RBF(input_dim=X.shape[1], ARD=True)
             self.models.append(FakeGPR(X, Y[:, i:i+1], kern))
+            if i > 0:
+                # Only the first model's X is read (see MGPR.X), so the
+                # copies kept by the others are plain data, not trained
+                self.models[i].X.trainable = False
+
+    def calculate_factorizations(self, compute_iK=False):
+        '''
+        The controller is a deterministic GP, so by default the inverse kernel
+        matrix, which does not enter its predictive variance, is not computed
+        (iK is None).
+        '''
+        return MGPR.calculate_factorizations(self, compute_iK=compute_iK)
 
-    def compute_action(self, m, s, squash=True):
+    def compute_action(self, m, s, squash=True, factorizations=None):
         '''
         RBF Controller. See Deisenroth's Thesis Section
-        IN: mean (m) and variance (s) of the state
+        IN: mean (m) and variance (s) of the state, and optionally the
+            (iK, beta) returned by calculate_factorizations, which do not
+            depend on m and s and can be computed once for a whole rollout
         OUT: mean (M) and variance (S) of the action
         '''
-        iK, beta = self.calculate_factorizations()
-        M, S, V = self.predict_given_factorizations(m, s, 0.0 * iK, beta)
-        S = S - tf.diag(self.variance - 1e-6)
+        if factorizations is None:
+            factorizations = self.calculate_factorizations()
+        iK, beta = factorizations
+        M, S, V = self.predict_given_factorizations(m, s, iK, beta)
+        S = tf.matrix_set_diag(S, tf.diag_part(S) - (self.variance - 1e-6))
         if squash:
             M, S, V2 = squash_sin(M, S, self.max_action)
             V = V @ V2
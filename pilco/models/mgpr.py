@@ -68,11 +68,11 @@ class MGPR(gpflow.Parameterized):
         iK, beta = self.calculate_factorizations()
         return self.predict_given_factorizations(m, s, iK, beta)
 
-    def calculate_factorizations(self):
+    def calculate_factorizations(self, compute_iK=True):
         K = self.K(self.X)
         batched_eye = tf.eye(tf.shape(self.X)[0], batch_shape=[self.num_outputs], dtype=float_type)
         L = tf.cholesky(K + self.noise[:, None, None]*batched_eye)
-        iK = tf.cholesky_solve(L, batched_eye)
+        iK = tf.cholesky_solve(L, batched_eye) if compute_iK else None
         Y_ = tf.transpose(self.Y)[:, :, None]
         # Why do we transpose Y? Maybe we need to change the definition of self.Y() or beta?
         beta = tf.cholesky_solve(L, Y_)[:, :, 0]
@@ -84,6 +84,8 @@ class MGPR(gpflow.Parameterized):
         IN: mean (m) (row vector) and (s) variance of the state
         OUT: mean (M) (row vector), variance (S) of the action
              and inv(s)*input-ouputcovariance
+        If iK is None the GP is treated as deterministic and the
+        correction for the uncertainty of the latent function is skipped.
         """
 
         s = tf.tile(s[None, None, :, :], [self.num_outputs, self.num_outputs, 1, 1])
@@ -130,8 +132,9 @@ class MGPR(gpflow.Parameterized):
                 tf.tile(beta[None, :, :, None], [self.num_outputs, 1, 1, 1])
             )[:, :, 0, 0]
 
-        diagL = tf.transpose(tf.linalg.diag_part(tf.transpose(L)))
-        S = S - tf.diag(tf.reduce_sum(tf.multiply(iK, diagL), [1, 2]))
+        if iK is not None:
+            diagL = tf.transpose(tf.linalg.diag_part(tf.transpose(L)))
+            S = S - tf.diag(tf.reduce_sum(tf.multiply(iK, diagL), [1, 2]))
         S = S / tf.sqrt(tf.linalg.det(R))
         S = S + tf.diag(self.variance)
         S = S - M @ tf.transpose(M)
@@ -142,9 +145,16 @@ class MGPR(gpflow.Parameterized):
         return self.X - m
 
     def K(self, X1, X2=None):
-        return tf.stack(
-            [model.kern.K(X1, X2) for model in self.models]
-        )
+        # All models share an ARD RBF kernel over the same inputs, so the
+        # kernel matrices of every output are computed in one batched pass
+        lengthscales = self.lengthscales[:, None, :]
+        X1 = X1[None, :, :] / lengthscales
+        X2 = X1 if X2 is None else X2[None, :, :] / lengthscales
+        X1s = tf.reduce_sum(tf.square(X1), -1)
+        X2s = tf.reduce_sum(tf.square(X2), -1)
+        r2 = -2 * tf.matmul(X1, X2, transpose_b=True) + \
+            X1s[:, :, None] + X2s[:, None, :]
+        return self.variance[:, None, None] * tf.exp(-r2 / 2)
 
     @property
     def Y(self):
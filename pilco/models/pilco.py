@@ -118,6 +118,10 @@ class PILCO(gpflow.models.Model):
         return self.controller.compute_action(x_m, tf.zeros([self.state_dim, self.state_dim], float_type))[0]
 
     def predict(self, m_x, s_x, n):
+        # The controller's factorizations do not depend on the state, so
+        # they are computed once here instead of in every loop iteration
+        controller_factorizations = self.controller.calculate_factorizations()
+
         loop_vars = [
             tf.constant(0, tf.int32),
             m_x,
@@ -131,15 +135,16 @@ class PILCO(gpflow.models.Model):
             # Body function
             lambda j, m_x, s_x, reward: (
                 j + 1,
-                *self.propagate(m_x, s_x),
+                *self.propagate(m_x, s_x, controller_factorizations),
                 tf.add(reward, self.reward.compute_reward(m_x, s_x)[0])
             ), loop_vars
         )
 
         return m_x, s_x, reward
 
-    def propagate(self, m_x, s_x):
-        m_u, s_u, c_xu = self.controller.compute_action(m_x, s_x)
+    def propagate(self, m_x, s_x, controller_factorizations=None):
+        m_u, s_u, c_xu = self.controller.compute_action(
+            m_x, s_x, factorizations=controller_factorizations)
 
         m = tf.concat([m_x, m_u], axis=1)
         s1 = tf.concat([s_x, s_x@c_xu], axis=1)
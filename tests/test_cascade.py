@@ -1,7 +1,9 @@
 from pilco.models import MGPR
 from pilco.models.pilco import PILCO
+from pilco.controllers import RbfController
 import numpy as np
 import os
+import tensorflow as tf
 from gpflow import autoflow
 from gpflow import settings
 import oct2py
@@ -22,6 +24,54 @@ def predict_wrapper(pilco, m, s, horizon):
 def compute_action_wrapper(pilco, m, s):
     return pilco.controller.compute_action(m, s)
 
+def controller_gradients(pilco, reward):
+    controller = pilco.controller
+    params = [controller.models[0].X.unconstrained_tensor] + \
+        [model.Y.unconstrained_tensor for model in controller.models] + \
+        [model.kern.lengthscales.unconstrained_tensor for model in controller.models]
+    return tf.gradients(reward, params)
+
+@autoflow((float_type,[None, None]), (float_type,[None, None]))
+def predict_with_gradients_wrapper(pilco, m, s):
+    m, s, reward = pilco.predict(m, s, pilco.horizon)
+    return [m, s, reward] + controller_gradients(pilco, reward)
+
+@autoflow((float_type,[None, None]), (float_type,[None, None]))
+def stepwise_predict_with_gradients_wrapper(pilco, m, s):
+    # Unrolled rollout where compute_action factorizes the controller itself at every step
+    reward = tf.constant([[0]], float_type)
+    for _ in range(pilco.horizon):
+        reward = reward + pilco.reward.compute_reward(m, s)[0]
+        m, s = pilco.propagate(m, s)
+    return [m, s, reward] + controller_gradients(pilco, reward)
+
+def test_rbf_rollout():
+    np.random.seed(0)
+    d = 2  # State dimenstion
+    k = 1  # Controller's output dimension
+    b = 10 # basis functions
+    horizon = 5
+
+    # Training Dataset
+    X0 = np.random.rand(100, d + k)
+    A = np.random.rand(d + k, d)
+    Y0 = np.sin(X0).dot(A) + 1e-3*(np.random.rand(100, d) - 0.5)  #  Just something smooth
+    controller = RbfController(state_dim=d, control_dim=k, num_basis_functions=b, max_action=10.0)
+    pilco = PILCO(X0, Y0, controller=controller, horizon=horizon)
+
+    # Generate input
+    m = np.random.rand(1, d)
+    s = np.random.rand(d, d)
+    s = s.dot(s.T)  # Make s positive semidefinite
+
+    # predict() factorizes the controller once, outside of the tf.while_loop
+    results = predict_with_gradients_wrapper(pilco, m, s)
+    expected = stepwise_predict_with_gradients_wrapper(pilco, m, s)
+
+    assert len(results) == len(expected)
+    for result, expected_result in zip(results, expected):
+        np.testing.assert_allclose(result, expected_result, rtol=1e-6, atol=1e-10)
+
 def test_cascade():
     np.random.seed(0)
     d = 2  # State dimenstion
@@ -86,4 +136,5 @@ def test_cascade():
 
 
 if __name__ == '__main__':
+    test_rbf_rollout()
     test_cascade()
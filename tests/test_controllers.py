@@ -119,8 +119,36 @@ def test_squash():
     np.testing.assert_allclose(S, S_mat, rtol=1e-4)
     np.testing.assert_allclose(V, V_mat, rtol=1e-4)
 
+def test_squash_single_control():
+    np.random.seed(0)
+    d = 1  # Control dimensions, taking the scalar path of squash_sin
+
+    m = np.random.rand(1, d)  # But MATLAB defines it as m'
+    s = np.random.rand(d, d)
+    s = s.dot(s.T)
+    e = 7.0
+
+    M, S, V = squash_sin(m, s, e)
+    sess = tf.Session()
+    M, S, V = sess.run([M, S, V])
+
+    M_mat, S_mat, V_mat = octave.gSin(m.T, s, e, nout=3)
+    # Octave returns 1x1 matrices as scalars
+    M_mat = np.reshape(M_mat, (d, 1))
+    S_mat = np.reshape(S_mat, (d, d))
+    V_mat = np.reshape(V_mat, (d, d))
+
+    assert M.shape == M_mat.T.shape
+    assert S.shape == S_mat.shape
+    assert V.shape == V_mat.shape
+
+    np.testing.assert_allclose(M, M_mat.T, rtol=1e-4)
+    np.testing.assert_allclose(S, S_mat, rtol=1e-4)
+    np.testing.assert_allclose(V, V_mat, rtol=1e-4)
+
 
 if __name__ == '__main__':
     test_rbf()
     test_linear()
     test_squash()
+    test_squash_single_control()